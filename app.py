@@ -1,5 +1,6 @@
 import base64
-import json
+import copy
+import orjson
 import dash
 import dash_bootstrap_components as dbc
 from dash import dcc
@@ -17,6 +18,7 @@ from indeterminatebeam.loading import (
 )
 from datetime import datetime
 import time
+from functools import lru_cache
 from indeterminatebeam.version import __version__
 from indeterminatebeam.units import IMPERIAL_UNITS, METRIC_UNITS, UNIT_KEYS, UNIT_VALUES, default_units
 from indeterminatebeam.data_validation import (
@@ -27,7 +29,11 @@ from indeterminatebeam.data_validation import (
 from dash_extensions import Download
 from dash.exceptions import PreventUpdate
 from plotly.io import to_html
-import plotly.graph_objects as go
+import plotly.io as pio
+
+# dash encodes callback outputs (including figures) with plotly's json
+# engine, use orjson explicitly rather than silently falling back to json.
+pio.json.config.default_engine = 'orjson'
 
 # set up background task to run every 14 minutes so server stays live
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -117,6 +123,16 @@ copyright_ = dbc.Row(
 
 
 
+# one Format per unit suffix, shared by every column that uses that suffix
+_FMT_CACHE = {}
+
+
+def _fmt(suffix):
+    if suffix not in _FMT_CACHE:
+        _FMT_CACHE[suffix] = Format(symbol=Symbol.yes, symbol_suffix=suffix)
+    return _FMT_CACHE[suffix]
+
+
 def create_table(id_, table, init, row_deletable = True):
     if init:
         data = [init]
@@ -132,9 +148,7 @@ def create_table(id_, table, init, row_deletable = True):
             'deletable': False,
             'renamable': False,
             'type': table[d]['type'],
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=table[d]['units'])
+            'format': _fmt(table[d]['units'])
         } for d in table.keys()],
         data=data,
         editable=True,
@@ -285,6 +299,27 @@ basic_support_table_data = {
 basic_support_table_init = {k: v['init']
                             for k, v in basic_support_table_data.items()}
 
+# restraint in each direction for each basic support, used to convert
+# basic supports to the same format as advanced supports.
+basic_support_restraints = {
+    'fixed': {'X': 'R', 'Y': 'R', 'M': 'R'},
+    'pinned': {'X': 'R', 'Y': 'R', 'M': 'F'},
+    'roller': {'X': 'F', 'Y': 'R', 'M': 'F'},
+}
+
+# degree of freedom for the restrained and free codes of the support tables
+restraint_codes = {'r': 1, 'R': 1, 'f': 0, 'F': 0}
+
+
+def parse_restraint(value, direction, spring=True):
+    # returns (DOF, stiffness), a positive number is a spring stiffness
+    if value in restraint_codes:
+        return restraint_codes[value], 0
+    elif spring and float(value) > 0:
+        return 0, float(value)
+    raise ValueError(
+        f'input incorrect for {direction} restraint of support')
+
 
 basic_support_table = dash_table.DataTable(
     id='basic-support-table',
@@ -575,7 +610,7 @@ option_instructions = dcc.Markdown('''
                which can be revealed by hoverlabels.
             4. Data points:
                - Number of increments used for plotting graphs, higher number
-               results in longer calculation speeds.
+               results in smoother graphs but larger figures to load.
             ''')
 
 def create_option(label, id_, options=[],default=None,option_dict = None):
@@ -697,32 +732,29 @@ def unit_option_formgroup(group='SI',label='length',units=('m'),default ='m'):
     
     return _
 
-# create a simplified method to write the SI_editor
-SI_editor = []
-group = "SI"
-for label in UNIT_KEYS:
-    units = [a for a in METRIC_UNITS[label].keys()]
-    SI_editor.append(
-        unit_option_formgroup(group, label, [default_units[group][label]], default_units[group][label])
-    )
+def unit_editor(group, unit_options):
+    """Define formgroups for every unit option of a group"""
+    return [
+        unit_option_formgroup(group, label, unit_options[label], default_units[group][label])
+        for label in UNIT_KEYS
+    ]
 
-metric_editor = []
-group = "metric"
-for label in UNIT_KEYS:
-    units = [a for a in METRIC_UNITS[label].keys()]
-    id_ = group + "_" + label
-    metric_editor.append(
-        unit_option_formgroup(group, label, units, default_units[group][label])
-    )
+def unit_dictionary(unit_values):
+    """Group the SI, metric and imperial unit option values (as passed to
+    callbacks, in UNIT_KEYS order) into a dictionary for each group"""
+    n = len(UNIT_KEYS)
+    return {
+        group: dict(zip(UNIT_KEYS, unit_values[i * n:(i + 1) * n]))
+        for i, group in enumerate(("SI", "metric", "imperial"))
+    }
 
-imperial_editor = []
-group = "imperial"
-for label in UNIT_KEYS:
-    units = [a for a in IMPERIAL_UNITS[label].keys()]
-    id_ = group + "_" + label
-    imperial_editor.append(
-        unit_option_formgroup(group, label, units, default_units[group][label])
-    )
+# SI units are fixed, only the default unit is offered for each option
+SI_editor = unit_editor(
+    "SI", {label: [default_units["SI"][label]] for label in UNIT_KEYS})
+metric_editor = unit_editor(
+    "metric", {label: list(METRIC_UNITS[label].keys()) for label in UNIT_KEYS})
+imperial_editor = unit_editor(
+    "imperial", {label: list(IMPERIAL_UNITS[label].keys()) for label in UNIT_KEYS})
 
 #option to change units for inputs and outputs
 option_units = create_option(
@@ -988,186 +1020,34 @@ unit_callback_state = [State('SI_'+a,'value') for a in METRIC_UNITS.keys()]
 unit_callback_state += [State('metric_'+a,'value') for a in METRIC_UNITS.keys()]
 unit_callback_state += [State('imperial_'+a,'value') for a in IMPERIAL_UNITS.keys()]
 
-@app.callback(
-    [
-        Output('graph_1', 'figure'),
-        Output('graph_2', 'figure'),
-        Output('alert-fade', 'color'),
-        Output('alert-fade', 'children'),
-        Output('alert-fade', 'is_open'),
-        Output('results-table', 'data'),
-        Output('input-json', 'data'),
-        Output('submit_button', 'disabled'),
-    ],
-    [
-        Input('submit_button', 'n_clicks'),
-        Input('dummy-div', 'children'),
-    ],
-    [
-        State('beam-table', 'data'),
-        State('point-load-table', 'data'),
-        State('point-torque-table', 'data'),
-        State('query-table', 'data'),
-        State('distributed-load-table', 'data'),
-        State('support-table', 'data'),
-        State('basic-support-table', 'data'),
-        State('graph_1', 'figure'),
-        State('graph_2', 'figure'),
-        State('input-json', 'data'),
-        State('option_support_input', 'value'),
-        State('option_default_support','value'),
-        State('option_positive_direction_y', 'value'),
-        State('option_data_points', 'value'),
-        State('option_precision','value'),
-        State('option_result_table', 'value'),
-        State('option_units', 'value'),
-    ] + unit_callback_state
-    )
-def analyse_beam(
-        click,
-        dummy_div,
-        beams,
-        point_loads,
-        point_torques,
-        querys,
-        distributed_loads,
-        advanced_supports,
-        basic_supports,
-        graph_1,
-        graph_2,
-        prev_input,
-        option_support,
-        option_default_support,
-        positive_y_direction,
-        data_points,
-        option_precision,
-        option_result_table,
-        option_units,
-        SI_length,
-        SI_force,
-        SI_moment,
-        SI_distributed,
-        SI_stiffness,
-        SI_A,
-        SI_E,
-        SI_I,
-        SI_deflection,
-        metric_length,
-        metric_force,
-        metric_moment,
-        metric_distributed,
-        metric_stiffness,
-        metric_A,
-        metric_E,
-        metric_I,
-        metric_deflection,
-        imperial_length,
-        imperial_force,
-        imperial_moment,
-        imperial_distributed,
-        imperial_stiffness,
-        imperial_A,
-        imperial_E,
-        imperial_I,
-        imperial_deflection,
-        ):
-
-    ctx = dash.callback_context
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-
-    # if an update was raised by button, and that was by a additional row, dont run.
-    if dummy_div is False and button_id == 'dummy-div':
-        raise PreventUpdate
-
-    t1 = time.perf_counter()
-
-    units = {}
-
-    units['SI'] = {
-        'length':SI_length,
-        'force':SI_force,
-        'moment':SI_moment,
-        'distributed':SI_distributed,
-        'stiffness':SI_stiffness,
-        'A':SI_A,
-        'E':SI_E,
-        'I':SI_I,
-        'deflection':SI_deflection,
-    }
-
-    units['metric'] = {
-        'length':metric_length,
-        'force':metric_force,
-        'moment':metric_moment,
-        'distributed':metric_distributed,
-        'stiffness':metric_stiffness,
-        'A':metric_A,
-        'E':metric_E,
-        'I':metric_I,
-        'deflection':metric_deflection,
-    }
-
-    units['imperial'] = {
-        'length':imperial_length,
-        'force':imperial_force,
-        'moment':imperial_moment,
-        'distributed':imperial_distributed,
-        'stiffness':imperial_stiffness,
-        'A':imperial_A,
-        'E':imperial_E,
-        'I':imperial_I,
-        'deflection':imperial_deflection,
-        }
-
-    # jsonify all inputs
-    input_json = json.dumps(
-        {
-            'beam': beams,
-            'advanced_supports': advanced_supports,
-            'basic_supports': basic_supports,
-            'point_loads': point_loads,
-            'point_torques': point_torques,
-            'distributed_loads': distributed_loads,
-            'querys': querys,
-            'adv_sup': option_support,
-            'default_support':option_default_support,
-            'y': positive_y_direction,
-            'data_points': data_points,
-            'option_precision': option_precision,
-            'option_units': option_units,
-            'result_table': option_result_table,
-            'unit_dictionary': units,
-        }
-    )
-
-    for i, s in enumerate(basic_supports):
-        sup = s.pop('Support')
-        if sup == 'fixed':
-            s['X'] = 'R'
-            s['Y'] = 'R'
-            s['M'] = 'R'
-        elif sup == 'pinned':
-            s['X'] = 'R'
-            s['Y'] = 'R'
-            s['M'] = 'F'
-        elif sup == 'roller':
-            s['X'] = 'F'
-            s['Y'] = 'R'
-            s['M'] = 'F'
-        basic_supports[i] = s
+@lru_cache(maxsize=16)
+def analyse_beam_inputs(beam_json):
+    data = orjson.loads(beam_json)
+
+    beams = data['beam']
+    advanced_supports = data['advanced_supports']
+    basic_supports = data['basic_supports']
+    point_loads = data['point_loads']
+    point_torques = data['point_torques']
+    distributed_loads = data['distributed_loads']
+    option_support = data['adv_sup']
+    positive_y_direction = data['y']
+    data_points = data['data_points']
+    option_precision = data['option_precision']
+    option_units = data['option_units']
+    units = data['unit_dictionary']
 
     if option_support == 'advanced':
         supports = advanced_supports
     else:
-        supports = basic_supports
-
-    # if all inputs the same as stored inputs then
-    # no need to calculate again.
-    # if clicks 0 then inputs are set to prev input
-    # hence they will be the same but will need to run the
-    # analysis to show the results.
-    if input_json == prev_input and click > 0:
-        raise PreventUpdate
+        supports = []
+        for s in basic_supports:
+            if s['Support'] not in basic_support_restraints:
+                raise ValueError(
+                    f"input incorrect for support type: {s['Support']}")
+            supports.append(
+                {'Coordinate': s['Coordinate'], **basic_support_restraints[s['Support']]}
+            )
 
     # try:
 
@@ -1179,7 +1059,7 @@ def analyse_beam(
     for row in beams:
         beam = Beam(*(float(a) for a in row.values()))
 
-    beam._DATA_POINTS = data_points
+    beam.update_data_points(int(data_points))
     beam.update_decimal_precision(option_precision)
 
 
@@ -1195,39 +1075,9 @@ def analyse_beam(
 
     if supports:
         for row in supports:
-            if row['X'] in ['r', 'R']:
-                DOF_x = 1
-                kx = 0
-            elif row['X'] in ['f', 'F']:
-                DOF_x = 0
-                kx = 0
-            elif float(row['X']) > 0:
-                DOF_x = 0
-                kx = float(row['X'])
-            else:
-                raise ValueError(
-                    'input incorrect for x restraint of support')
-
-            if row['Y'] in ['r', 'R']:
-                DOF_y = 1
-                ky = 0
-            elif row['Y'] in ['f', 'F']:
-                DOF_y = 0
-                ky = 0
-            elif float(row['Y']) > 0:
-                DOF_y = 0
-                ky = float(row['Y'])
-            else:
-                raise ValueError(
-                    'input incorrect for y restraint of support')
-
-            if row['M'] in ['r', 'R']:
-                DOF_m = 1
-            elif row['M'] in ['f', 'F']:
-                DOF_m = 0
-            else:
-                raise ValueError(
-                    'input incorrect for m restraint of support')
+            DOF_x, kx = parse_restraint(row['X'], 'x')
+            DOF_y, ky = parse_restraint(row['Y'], 'y')
+            DOF_m, _ = parse_restraint(row['M'], 'm', spring=False)
 
             beam.add_supports(
                 Support(
@@ -1280,20 +1130,43 @@ def analyse_beam(
 
     beam.analyse()
 
+    graph_1 = beam.plot_beam_external()
+
+    return beam, graph_1
+
+
+# the analysis only depends on the serialised inputs, keep the outputs for
+# the most recent inputs so returning to a previous beam (or reloading the
+# page with saved inputs) does not solve it again.
+@lru_cache(maxsize=16)
+def analyse_inputs(input_json):
+    data = orjson.loads(input_json)
+
+    querys = data.pop('querys')
+    option_precision = data['option_precision']
+    option_units = data['option_units']
+    units = data['unit_dictionary']
+
+    # these options only change the page, not the beam
+    del data['result_table'], data['default_support']
+
+    # the beam is analysed without query points so that changing only the
+    # query points reuses the solved beam, query points are added to a copy
+    # to leave the cached beam unchanged.
+    beam, graph_1 = analyse_beam_inputs(orjson.dumps(data))
+    beam = copy.copy(beam)
+    beam.remove_query_points(remove_all=True)
+
     if querys:
         for row in querys:
             beam.add_query_points(
                 float(row['Query coordinate']),
             )
 
-    graph_1 = beam.plot_beam_external()
-
     graph_2 = beam.plot_beam_internal()
 
-    # results data is actually adding to the calc time significantly.
-    # Might be worth trying to find a more efficient method,
-    # for example getting max, min and x values all in one go could mean
-    # dont need to generate vectors multiple times, can save time.
+    # max and min are found once when the beam is analysed, query points
+    # are evaluated together with one call for each result.
 
     # get precision for display and assign to p
     p = option_precision
@@ -1316,19 +1189,129 @@ def analyse_beam(
     ]
 
     if querys:
-        for row in querys:
-            x_ = row['Query coordinate']
-            u_ = units[option_units]['length']
+        xs = [row['Query coordinate'] for row in querys]
+        query_values = [
+            beam.get_normal_force(*xs),
+            beam.get_shear_force(*xs),
+            beam.get_bending_moment(*xs),
+            beam.get_deflection(*xs),
+        ]
+        # a single query point is returned as a value rather than a list
+        if len(xs) == 1:
+            query_values = [[v] for v in query_values]
+
+        u_ = units[option_units]['length']
+        for x_, nf, sf, bm, d in zip(xs, *query_values):
             results_data.append(
                 {
                     'val': f'x = {x_} {u_}',
-                    'NF (' + units[option_units]['force'] +')': f'{beam.get_normal_force(x_):.{p}f}',
-                    'SF (' + units[option_units]['force'] +')': f'{beam.get_shear_force(x_):.{p}f}',
-                    'BM (' + units[option_units]['moment'] +')': f'{beam.get_bending_moment(x_):.{p}f}',
-                    'D (' + units[option_units]['deflection'] +')': f'{beam.get_deflection(x_):.{p}f}',
+                    'NF (' + units[option_units]['force'] +')': f'{nf:.{p}f}',
+                    'SF (' + units[option_units]['force'] +')': f'{sf:.{p}f}',
+                    'BM (' + units[option_units]['moment'] +')': f'{bm:.{p}f}',
+                    'D (' + units[option_units]['deflection'] +')': f'{d:.{p}f}',
                 },
             )
 
+    return graph_1, graph_2, results_data
+
+
+@app.callback(
+    [
+        Output('graph_1', 'figure'),
+        Output('graph_2', 'figure'),
+        Output('alert-fade', 'color'),
+        Output('alert-fade', 'children'),
+        Output('alert-fade', 'is_open'),
+        Output('results-table', 'data'),
+        Output('input-json', 'data'),
+        Output('submit_button', 'disabled'),
+    ],
+    [
+        Input('submit_button', 'n_clicks'),
+        Input('dummy-div', 'children'),
+    ],
+    [
+        State('beam-table', 'data'),
+        State('point-load-table', 'data'),
+        State('point-torque-table', 'data'),
+        State('query-table', 'data'),
+        State('distributed-load-table', 'data'),
+        State('support-table', 'data'),
+        State('basic-support-table', 'data'),
+        State('graph_1', 'figure'),
+        State('graph_2', 'figure'),
+        State('input-json', 'data'),
+        State('option_support_input', 'value'),
+        State('option_default_support','value'),
+        State('option_positive_direction_y', 'value'),
+        State('option_data_points', 'value'),
+        State('option_precision','value'),
+        State('option_result_table', 'value'),
+        State('option_units', 'value'),
+    ] + unit_callback_state
+    )
+def analyse_beam(
+        click,
+        dummy_div,
+        beams,
+        point_loads,
+        point_torques,
+        querys,
+        distributed_loads,
+        advanced_supports,
+        basic_supports,
+        graph_1,
+        graph_2,
+        prev_input,
+        option_support,
+        option_default_support,
+        positive_y_direction,
+        data_points,
+        option_precision,
+        option_result_table,
+        option_units,
+        *unit_values,
+        ):
+
+    # if an update was raised by button, and that was by a additional row, dont run.
+    if dummy_div is False and dash.callback_context.triggered_id == 'dummy-div':
+        raise PreventUpdate
+
+    t1 = time.perf_counter()
+
+    units = unit_dictionary(unit_values)
+
+    # jsonify all inputs (orjson serialises in C and returns bytes)
+    input_json = orjson.dumps(
+        {
+            'beam': beams,
+            'advanced_supports': advanced_supports,
+            'basic_supports': basic_supports,
+            'point_loads': point_loads,
+            'point_torques': point_torques,
+            'distributed_loads': distributed_loads,
+            'querys': querys,
+            'adv_sup': option_support,
+            'default_support':option_default_support,
+            'y': positive_y_direction,
+            'data_points': data_points,
+            'option_precision': option_precision,
+            'option_units': option_units,
+            'result_table': option_result_table,
+            'unit_dictionary': units,
+        }
+    ).decode()
+
+    # if all inputs the same as stored inputs then
+    # no need to calculate again (checked before any other work).
+    # if clicks 0 then inputs are set to prev input
+    # hence they will be the same but will need to run the
+    # analysis to show the results.
+    if input_json == prev_input and click > 0:
+        raise PreventUpdate
+
+    graph_1, graph_2, results_data = analyse_inputs(input_json)
+
     t2 = time.perf_counter()
     t = t2 - t1
     dt = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
@@ -1436,33 +1419,7 @@ def update_tables(
     option_precision,
     option_units,
     input_json_data,
-    SI_length,
-    SI_force,
-    SI_moment,
-    SI_distributed,
-    SI_stiffness,
-    SI_A,
-    SI_E,
-    SI_I,
-    SI_deflection,
-    metric_length,
-    metric_force,
-    metric_moment,
-    metric_distributed,
-    metric_stiffness,
-    metric_A,
-    metric_E,
-    metric_I,
-    metric_deflection,
-    imperial_length,
-    imperial_force,
-    imperial_moment,
-    imperial_distributed,
-    imperial_stiffness,
-    imperial_A,
-    imperial_E,
-    imperial_I,
-    imperial_deflection,
+    *unit_values,
     ):
     #solution summary:
     # in order to automatically update tables to previously stored information
@@ -1477,43 +1434,7 @@ def update_tables(
     if not input_json_data:
         raise PreventUpdate
 
-    units = {}
-
-    units['SI'] = {
-        'length':SI_length,
-        'force':SI_force,
-        'moment':SI_moment,
-        'distributed':SI_distributed,
-        'stiffness':SI_stiffness,
-        'A':SI_A,
-        'E':SI_E,
-        'I':SI_I,
-        'deflection':SI_deflection,
-    }
-
-    units['metric'] = {
-        'length':metric_length,
-        'force':metric_force,
-        'moment':metric_moment,
-        'distributed':metric_distributed,
-        'stiffness':metric_stiffness,
-        'A':metric_A,
-        'E':metric_E,
-        'I':metric_I,
-        'deflection':metric_deflection,
-    }
-
-    units['imperial'] = {
-        'length':imperial_length,
-        'force':imperial_force,
-        'moment':imperial_moment,
-        'distributed':imperial_distributed,
-        'stiffness':imperial_stiffness,
-        'A':imperial_A,
-        'E':imperial_E,
-        'I':imperial_I,
-        'deflection':imperial_deflection,
-        }
+    units = unit_dictionary(unit_values)
 
     units_values =[]
     for a in units.keys():
@@ -1546,17 +1467,14 @@ def update_tables(
 
         # report uploaded
         elif ctx.triggered[0]['prop_id'].split('.')[0] == 'upload-data':
-            data = upload_data.encode("utf8").split(b";base64,")[1]
-            data = base64.b64decode(data)
-            data = data.decode('utf-8')
-            data = data.split('--')[1]
-            data.replace('null', 'True')
-            data.replace('None', 'True')
-            data = json.loads(data)
+            # inputs are stored in the report as the first html comment,
+            # orjson reads the utf-8 bytes directly.
+            data = base64.b64decode(upload_data.split(";base64,", 1)[1])
+            data = orjson.loads(data.split(b'--', 2)[1])
             
         #website started with saved data
         else:
-            data = json.loads(input_json_data)
+            data = orjson.loads(input_json_data)
 
         dummy_div = True
 
@@ -1751,7 +1669,8 @@ def toggle_collapse(n, is_open):
         a = not is_open
     else:
         a = is_open
-    return a, a, a, a, a, a, a, a
+    # same state for each of the instruction collapses
+    return (a,) * 8
 
 # if any of the unit values change update the table columns
 unit_input = [Input('SI_'+a,'value') for a in METRIC_UNITS.keys()]
@@ -1776,74 +1695,13 @@ unit_input += [Input('imperial_'+a,'value') for a in IMPERIAL_UNITS.keys()]
 )
 def update_tables(
     option_units,
-    SI_length,
-    SI_force,
-    SI_moment,
-    SI_distributed,
-    SI_stiffness,
-    SI_A,
-    SI_E,
-    SI_I,
-    SI_deflection,
-    metric_length,
-    metric_force,
-    metric_moment,
-    metric_distributed,
-    metric_stiffness,
-    metric_A,
-    metric_E,
-    metric_I,
-    metric_deflection,
-    imperial_length,
-    imperial_force,
-    imperial_moment,
-    imperial_distributed,
-    imperial_stiffness,
-    imperial_A,
-    imperial_E,
-    imperial_I,
-    imperial_deflection,
-    input_json_data,
+    *args,
     ):
+    # unit values are followed by the stored input state
+    *unit_values, input_json_data = args
     if not input_json_data:
         raise PreventUpdate
-    units = {}
-
-    units['SI'] = {
-        'length':SI_length,
-        'force':SI_force,
-        'moment':SI_moment,
-        'distributed':SI_distributed,
-        'stiffness':SI_stiffness,
-        'A':SI_A,
-        'E':SI_E,
-        'I':SI_I,
-        'deflection':SI_deflection,
-    }
-
-    units['metric'] = {
-        'length':metric_length,
-        'force':metric_force,
-        'moment':metric_moment,
-        'distributed':metric_distributed,
-        'stiffness':metric_stiffness,
-        'A':metric_A,
-        'E':metric_E,
-        'I':metric_I,
-        'deflection':metric_deflection,
-    }
-
-    units['imperial'] = {
-        'length':imperial_length,
-        'force':imperial_force,
-        'moment':imperial_moment,
-        'distributed':imperial_distributed,
-        'stiffness':imperial_stiffness,
-        'A':imperial_A,
-        'E':imperial_E,
-        'I':imperial_I,
-        'deflection':imperial_deflection,
-        }
+    units = unit_dictionary(unit_values)
 
     #update table default propertie
     beam_table_data['Length']['units'] = ' '+units[option_units]['length']
@@ -1858,9 +1716,7 @@ def update_tables(
             'deletable': False,
             'renamable': False,
             'type': beam_table_data[d]['type'],
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=beam_table_data[d]['units'])
+            'format': _fmt(beam_table_data[d]['units'])
         } for d in beam_table_data.keys()]
 
     support_table_data['Coordinate']['units'] = ' '+units[option_units]['length']
@@ -1875,9 +1731,7 @@ def update_tables(
             'deletable': False,
             'renamable': False,
             'type': support_table_data[d]['type'],
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=support_table_data[d]['units'])
+            'format': _fmt(support_table_data[d]['units'])
         } for d in support_table_data.keys()]
 
     basic_support_table_columns =[
@@ -1888,9 +1742,7 @@ def update_tables(
             'renamable': False,
             'type': 'numeric',
             'presentation': 'input',
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=' '+units[option_units]['length'])
+            'format': _fmt(' '+units[option_units]['length'])
         },
         {
             'name': 'Support',
@@ -1902,20 +1754,6 @@ def update_tables(
         },
     ]
 
-    support_table_columns =[
-        {
-            'name': d,
-            'id': d,
-            'deletable': False,
-            'renamable': False,
-            'type': support_table_data[d]['type'],
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=support_table_data[d]['units'])
-        } for d in support_table_data.keys()
-    ]
-
-
     # Properties for point_load Tab
     point_load_table_data['Coordinate']['units'] = ' '+units[option_units]['length']
     point_load_table_data['Force']['units'] = ' '+units[option_units]['force']
@@ -1927,9 +1765,7 @@ def update_tables(
             'deletable': False,
             'renamable': False,
             'type': point_load_table_data[d]['type'],
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=point_load_table_data[d]['units'])
+            'format': _fmt(point_load_table_data[d]['units'])
         } for d in point_load_table_data.keys()
     ]
 
@@ -1942,9 +1778,7 @@ def update_tables(
             'deletable': False,
             'renamable': False,
             'type': point_torque_table_data[d]['type'],
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=point_torque_table_data[d]['units'])
+            'format': _fmt(point_torque_table_data[d]['units'])
         } for d in point_torque_table_data.keys()
     ]
     
@@ -1960,9 +1794,7 @@ def update_tables(
             'deletable': False,
             'renamable': False,
             'type': distributed_load_table_data[d]['type'],
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=distributed_load_table_data[d]['units'])
+            'format': _fmt(distributed_load_table_data[d]['units'])
         } for d in distributed_load_table_data.keys()
     ]
 
@@ -1974,9 +1806,7 @@ def update_tables(
             'deletable': False,
             'renamable': False,
             'type': 'numeric',
-            'format': Format(
-                symbol=Symbol.yes,
-                symbol_suffix=' '+units[option_units]['length'])
+            'format': _fmt(' '+units[option_units]['length'])
         } for i in query_table_init.keys()
     ]
 
@@ -2000,6 +1830,29 @@ def update_tables(
     ]
 
 # Generate Report
+# static parts of the report results table,
+# table format appropriated from an online generator.
+# added page-break-after:always for formatting when print to pdf
+report_table_head = """
+            <style type="text/css">
+            .tg  {border-collapse:collapse;border-spacing:0;margin:20px;page-break-after:always}
+            .tg td{border-color:black;border-style:solid;border-width:1px;font-family:Arial, sans-serif;font-size:14px;
+            overflow:hidden;padding:10px 20px;word-break:normal;}
+            .tg th{border-color:black;border-style:solid;border-width:1px;font-family:Arial, sans-serif;font-size:14px;
+            font-weight:normal;overflow:hidden;padding:10px 20px;word-break:normal;}
+            .tg .tg-5gn2{background-color:#efefef;font-family:Arial, Helvetica, sans-serif !important;;font-size:12px;text-align:center;
+            vertical-align:middle}
+            .tg .tg-uqo3{background-color:#efefef;text-align:center;vertical-align:top}
+            .tg .tg-baqh{text-align:center;vertical-align:top}
+            </style>
+            <table class="tg">
+            <thead>
+            """
+
+report_table_tail = """</tbody>
+            </table>
+            """
+
 @app.callback(
     Output("report", "data"),
     Input('report-button', 'n_clicks'),
@@ -2010,10 +1863,10 @@ def update_tables(
 )
 def report(n, graph_1, graph_2, results, input_json):
 
-    if not json or n==0:
+    if not input_json or n==0:
         raise PreventUpdate
 
-    unit_information = json.loads(input_json)
+    unit_information = orjson.loads(input_json)
     option_units = unit_information['option_units']
     units = unit_information['unit_dictionary']
 
@@ -2024,55 +1877,39 @@ def report(n, graph_1, graph_2, results, input_json):
     if n > 0:
         # for each row in the results table,
         # write html table row
-        table = [f"""<tr>
-                <td class="tg-baqh">{a['val']}</td>
-                <td class="tg-baqh">{a['NF (' + units[option_units]['force'] +')']}</td>
-                <td class="tg-baqh">{a['SF (' + units[option_units]['force'] +')']}</td>
-                <td class="tg-baqh">{a['BM (' + units[option_units]['moment'] +')']}</td>
-                <td class="tg-baqh">{a['D (' + units[option_units]['deflection'] +')']}</td>
-                </tr>
-                """ for a in results]
-
-        # join all the strings for each table row
-        table = ''.join(table)
+        columns = [
+            'val',
+            'NF (' + units[option_units]['force'] +')',
+            'SF (' + units[option_units]['force'] +')',
+            'BM (' + units[option_units]['moment'] +')',
+            'D (' + units[option_units]['deflection'] +')',
+        ]
+        table = ''.join(
+            '<tr>' + ''.join(f'<td class="tg-baqh">{a[c]}</td>' for c in columns) + '</tr>'
+            for a in results
+        )
 
         #help graph 2 fit better on the second page.
-        graph_2 = go.Figure(graph_2)
-        graph_2.update_layout(height=950)
+        # (graph_2 is the figure dict from the browser, set the height
+        # directly rather than rebuilding and validating a Figure)
+        graph_2.setdefault('layout', {})['height'] = 950
 
         # report to consist of graph_1, table and graph_2, and date generated tag
         # cant remember why to_html properties are set the way they are set.
-        # table format appropriated from an online generator.
-        # added page-break-after:always for formatting when print to pdf
         content = [
             "<!DOCTYPE html><html>",
             beam_data,
-            to_html(fig=graph_1, full_html=False, include_plotlyjs='cdn'),
-            """
-            <style type="text/css">
-            .tg  {border-collapse:collapse;border-spacing:0;margin:20px;page-break-after:always}
-            .tg td{border-color:black;border-style:solid;border-width:1px;font-family:Arial, sans-serif;font-size:14px;
-            overflow:hidden;padding:10px 20px;word-break:normal;}
-            .tg th{border-color:black;border-style:solid;border-width:1px;font-family:Arial, sans-serif;font-size:14px;
-            font-weight:normal;overflow:hidden;padding:10px 20px;word-break:normal;}
-            .tg .tg-5gn2{background-color:#efefef;font-family:Arial, Helvetica, sans-serif !important;;font-size:12px;text-align:center;
-            vertical-align:middle}
-            .tg .tg-uqo3{background-color:#efefef;text-align:center;vertical-align:top}
-            .tg .tg-baqh{text-align:center;vertical-align:top}
-            </style>
-            <table class="tg">
-            <thead>
-            """+ 
+            to_html(fig=graph_1, full_html=False, include_plotlyjs='cdn', validate=False),
+            report_table_head +
             f"""<tr>
                 <th class="tg-5gn2"></th>
                 <th class="tg-uqo3">Normal Force {units[option_units]['force']}</th>
                 <th class="tg-uqo3">Shear Force {units[option_units]['force']}</th>
                 <th class="tg-uqo3">Bending Moment {units[option_units]['moment']}</th>
                 <th class="tg-uqo3">Deflection {units[option_units]['deflection']}</th>
-            </tr>""" + table + """</tbody>
-            </table>
-            """,
-            to_html(fig=graph_2, full_html=False, include_plotlyjs='cdn'),
+            </tr>""" + table + report_table_tail,
+            # plotly.js is already loaded by the script tag of the first graph
+            to_html(fig=graph_2, full_html=False, include_plotlyjs=False, validate=False),
             f'<i>Report generated at https://indeterminatebeam.onrender.com/ {__version__} on {date}</i>',
             "</html>"
         ]
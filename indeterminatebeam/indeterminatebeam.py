@@ -16,20 +16,20 @@ Example
 
 # Standard Library Imports
 from collections import namedtuple
+from functools import lru_cache
 from math import radians
 import time
 
 # Third Party Imports
 import numpy as np
 from sympy import (
+    Add,
     integrate,
     lambdify,
     Piecewise,
     sympify,
     symbols,
-    linsolve,
-    sin,
-    cos,
+    linear_eq_to_matrix,
     oo,
     SingularityFunction,
 )
@@ -80,6 +80,21 @@ from indeterminatebeam.plotly_drawing_aid import (
 from indeterminatebeam.units import IMPERIAL_UNITS, METRIC_UNITS, UNIT_KEYS, UNIT_VALUES
 
 
+@lru_cache(maxsize=128)
+def _lambdify_equation(expr):
+    """Return a numpy function for part of a beam equation, cached so that
+    analysing the same beam (or loads) again only lambdifies once."""
+    return lambdify(x, expr, "numpy")
+
+
+@lru_cache(maxsize=512)
+def _singularity_to_piecewise(sf):
+    """Return the Piecewise form of a SingularityFunction. The rewrite only
+    depends on the load or support position and order (the beam topology),
+    so it is cached to be reused when magnitudes change between solves."""
+    return sf._eval_rewrite_as_Piecewise()
+
+
 class Support:
     """
     A class to represent a support.
@@ -214,6 +229,12 @@ class Beam:
         A sympy function representing the tangential deflection (default unit m) as
         a function of x (default unit m).
 
+    _singularity_equations: dictionary of sympy functions
+        The normal force, shear force, bending moment and deflection
+        equations (keys 'nf', 'sf', 'bm' and 'd') with singularity
+        functions not rewritten as piecewise functions, used to create
+        the functions evaluated for plotting and queries.
+
     _reactions: dictionary of lists
         A dictionary with keys for support positions. Each key is
         associated with a list of forces of the form ['x','y','m']
@@ -298,6 +319,7 @@ class Beam:
         self._bending_moments = 0
         self._deflection_equation = 0
 
+        self._singularity_equations = {}
         self._reactions = {}
         self._plotting_vectors = {}
 
@@ -444,6 +466,9 @@ class Beam:
 
         self._analysis_reset()
 
+        # positions that already have a support associated with them
+        positions = {a._position for a in self._supports}
+
         # Check support valid then append to self._supports
         for support in supports:
             # check is a Support object
@@ -454,16 +479,11 @@ class Beam:
             if (self._x0 > support._position) or (support._position > self._x1):
                 raise ValueError("Not a point on beam")
 
-            # if currently no supports then there is nothing the
-            # support being added can conflict with. Add it in.
-            if self._supports == []:
-                self._supports.append(support)
-
-            # if there are already supports associated with the
-            # beam object only add the new support if no support
-            # exists at the same position.
-            elif support._position not in [x._position for x in self._supports]:
+            # only add the new support if no support exists at the
+            # same position.
+            if support._position not in positions:
                 self._supports.append(support)
+                positions.add(support._position)
 
             # if already a supported associated with position raise error
             else:
@@ -530,6 +550,23 @@ class Beam:
 
         x1 = self._x1
 
+        # group loads by type once, as each group is used in several
+        # of the equations below.
+        point_loads = []
+        point_torques = []
+        distributed_loads = []
+        # UDL and TrapezoidalLoad both use singularity functions
+        singularity_loads = []
+        for load in self._loads:
+            if isinstance(load, PointLoad):
+                point_loads.append(load)
+            elif isinstance(load, PointTorque):
+                point_torques.append(load)
+            elif isinstance(load, DistributedLoad):
+                distributed_loads.append(load)
+            elif isinstance(load, (UDL, TrapezoidalLoad)):
+                singularity_loads.append(load)
+
         # initialised with position and stiffness.
         self._supports = sorted(self._supports, key=lambda item: item._position)
 
@@ -543,45 +580,43 @@ class Beam:
         # sympy variable and entry in unknowns dictionary.
         # for x and y singularity function power is 0 to be added in at SF level.
         # for m singularity function power is also 0, to be added in at BM level.
+        # The step function at the support position is shared by all of the
+        # reactions at that support, so is only created once.
         for a in self._supports:
+            step = SingularityFunction(x, a._position, 0)
             if a._stiffness[0] != 0:
+                variable = symbols("x_" + str(a._position))
                 unknowns["x"].append(
                     {
                         "position": a._position,
                         "stiffness": a._stiffness[0],
-                        "force": (
-                            symbols("x_" + str(a._position))
-                            * SingularityFunction(x, a._position, 0)
-                        ),
-                        "variable": symbols("x_" + str(a._position)),
+                        "force": variable * step,
+                        "variable": variable,
                     }
                 )
             if a._stiffness[1] != 0:
+                variable = symbols("y_" + str(a._position))
                 unknowns["y"].append(
                     {
                         "position": a._position,
                         "stiffness": a._stiffness[1],
-                        "force": (
-                            symbols("y_" + str(a._position))
-                            * SingularityFunction(x, a._position, 0)
-                        ),
-                        "variable": symbols("y_" + str(a._position)),
+                        "force": variable * step,
+                        "variable": variable,
                     }
                 )
             if a._stiffness[2] != 0:
+                variable = symbols("m_" + str(a._position))
                 unknowns["m"].append(
                     {
                         "position": a._position,
-                        "torque": (
-                            symbols("m_" + str(a._position))
-                            * SingularityFunction(x, a._position, 0)
-                        ),
-                        "variable": symbols("m_" + str(a._position)),
+                        "torque": variable * step,
+                        "variable": variable,
                     }
                 )
 
         # grab the set of all the sympy unknowns for y and m and change
-        # to a list, do same for x unknowns. To be later used by linsolve.
+        # to a list, do same for x unknowns. To be later used to solve the
+        # system of equations.
         unknowns_ym = [a["variable"] for a in unknowns["y"]] + [
             a["variable"] for a in unknowns["m"]
         ]
@@ -610,20 +645,9 @@ class Beam:
         # for loads ._x1 represents the load distribution integrated,
         # thereby giving the total load by the end of the support.
         F_Rx = (
-            sum(
-                [
-                    load._x1.subs(x, x1)
-                    for load in self._loads
-                    if isinstance(load, PointLoad)
-                ]
-            )
-            * units["force"]
+            sum([load._x1.subs(x, x1) for load in point_loads]) * units["force"]
             + sum(
-                [
-                    load._x1.subs(x, x1)
-                    for load in self._loads
-                    if isinstance(load, (UDL, DistributedLoad, TrapezoidalLoad))
-                ]
+                [load._x1.subs(x, x1) for load in singularity_loads + distributed_loads]
             )
             * units["distributed"]
             * units["length"]
@@ -632,20 +656,9 @@ class Beam:
 
         # similiar to F_Rx
         F_Ry = (
-            sum(
-                [
-                    load._y1.subs(x, x1)
-                    for load in self._loads
-                    if isinstance(load, PointLoad)
-                ]
-            )
-            * units["force"]
+            sum([load._y1.subs(x, x1) for load in point_loads]) * units["force"]
             + sum(
-                [
-                    load._y1.subs(x, x1)
-                    for load in self._loads
-                    if isinstance(load, (UDL, DistributedLoad, TrapezoidalLoad))
-                ]
+                [load._y1.subs(x, x1) for load in singularity_loads + distributed_loads]
             )
             * units["distributed"]
             * units["length"]
@@ -654,18 +667,11 @@ class Beam:
 
         # moments taken at the left of the beam, anti-clockwise is positive
         M_R = (
-            sum(load._m0 for load in self._loads if isinstance(load, PointLoad))
-            * units["force"]
-            * units["length"]
-            + sum(
-                load._m0
-                for load in self._loads
-                if isinstance(load, (UDL, DistributedLoad, TrapezoidalLoad))
-            )
+            sum(load._m0 for load in point_loads) * units["force"] * units["length"]
+            + sum(load._m0 for load in singularity_loads + distributed_loads)
             * units["distributed"]
             * units["length"] ** 2
-            + sum(load._m0 for load in self._loads if isinstance(load, PointTorque))
-            * units["moment"]
+            + sum(load._m0 for load in point_torques) * units["moment"]
             + sum([a["variable"] for a in unknowns["m"]])
             + sum([a["variable"] * a["position"] for a in unknowns["y"]])
             * units["length"]
@@ -677,30 +683,21 @@ class Beam:
 
         # normal forces, same concept as shear forces
         N_i_1 = (
-            sum(load._x1 for load in self._loads if isinstance(load, PointLoad))
-            * units["force"]
-            + sum(
-                load._x1
-                for load in self._loads
-                if isinstance(load, (UDL, TrapezoidalLoad))
-            )
+            sum(load._x1 for load in point_loads) * units["force"]
+            + sum(load._x1 for load in singularity_loads)
             * units["distributed"]
             * units["length"]
             + sum([a["force"] for a in unknowns["x"]])
         )
 
         N_i_2 = (
-            sum(load._x1 for load in self._loads if isinstance(load, DistributedLoad))
+            sum(load._x1 for load in distributed_loads)
             * units["distributed"]
             * units["length"]
         )
 
         N_i = N_i_1 + N_i_2
 
-        # integrate to get NF * x as a function of x. Needed
-        # later for displacement which is used if x springs are present
-        Nv_EA = integrate(N_i, x) * units["length"]
-
         # shear forces. At a point x within the beam the cumulative sum of the
         # vertical forces (represented by load._y1 + reactons) plus the
         # internal shear forces should be equal to 0. i.e.
@@ -714,20 +711,15 @@ class Beam:
         # by moment conversion and divide by length conversion to cancel out multiplying
         # by length conversion after integrating
         F_i_1 = (
-            sum(load._y1 for load in self._loads if isinstance(load, PointLoad))
-            * units["force"]
-            + sum(
-                load._y1
-                for load in self._loads
-                if isinstance(load, (UDL, TrapezoidalLoad))
-            )
+            sum(load._y1 for load in point_loads) * units["force"]
+            + sum(load._y1 for load in singularity_loads)
             * units["distributed"]
             * units["length"]
             + sum([a["force"] for a in unknowns["y"]])
         )
 
         F_i_2 = (
-            sum(load._y1 for load in self._loads if isinstance(load, DistributedLoad))
+            sum(load._y1 for load in distributed_loads)
             * units["distributed"]
             * units["length"]
         )
@@ -744,29 +736,25 @@ class Beam:
         # as a SingularityFunction of power -1 (the point moments are
         # therefore only considered once the integration below takes place)
         M_i_1 = (
-            integrate(F_i_1, x) * units["length"]
-            + integrate(
-                sum(load._y1 for load in self._loads if isinstance(load, PointTorque)),
-                x,
-            )
-            * units["moment"]
+            self._integrate(F_i_1) * units["length"]
+            + self._integrate(sum(load._y1 for load in point_torques)) * units["moment"]
             - sum([a["torque"] for a in unknowns["m"]])
         )
 
-        M_i_2 = integrate(F_i_2, x) * units["length"]
+        M_i_2 = self._integrate(F_i_2) * units["length"]
 
         M_i = M_i_1 + M_i_2
 
         # integrate M_i for beam slope equation
-        dv_EI_1 = integrate(M_i_1, x) * units["length"] + C1
-        dv_EI_2 = integrate(M_i_2, x) * units["length"]
+        dv_EI_1 = self._integrate(M_i_1) * units["length"] + C1
+        dv_EI_2 = self._integrate(M_i_2) * units["length"]
         dv_EI = dv_EI_1 + dv_EI_2
 
         # integrate M_i twice for deflection equation
         v_EI_1 = (
-            integrate(dv_EI_1, x) * units["length"] + C2
+            self._integrate(dv_EI_1) * units["length"] + C2
         )  # should c2 be multiplied by the value
-        v_EI_2 = integrate(dv_EI_2, x) * units["length"]
+        v_EI_2 = self._integrate(dv_EI_2) * units["length"]
         v_EI = v_EI_1 + v_EI_2
 
         # create a list of equations for tangential direction
@@ -797,6 +785,10 @@ class Beam:
 
         # Only perform calculation if axially indeterminate
         if len(unknowns_xx) > 1:
+            # integrate to get NF * x as a function of x. Needed
+            # for displacement which is used if x springs are present
+            Nv_EA = self._integrate(N_i) * units["length"]
+
             # Assign start to be the first x support.
             start = unknowns["x"][0]
             # For each support other than the start, set an endpoint
@@ -818,32 +810,30 @@ class Beam:
                     - end["variable"] / (end["stiffness"] * units["stiffness"])
                 )
 
-        # compute analysis with linsolve
-        solutions_ym = list(linsolve(equations_ym, unknowns_ym))[0]
-        solutions_xx = list(linsolve(equations_xx, unknowns_xx))[0]
+        # compute analysis. The unknowns enter the equations linearly so
+        # each set of equations is a square linear system, A * u = b,
+        # which is solved numerically.
+        solutions_ym = self._solve_linear_system(equations_ym, unknowns_ym)
+        solutions_xx = self._solve_linear_system(equations_xx, unknowns_xx)
 
         # Create solution dictionary
-        solutions = [a for a in solutions_ym + solutions_xx]
-        solution_dict = dict(zip(unknowns_ym + unknowns_xx, solutions))
+        solution_dict = dict(
+            zip(unknowns_ym + unknowns_xx, solutions_ym + solutions_xx)
+        )
 
         # Initialise self._reactions to hold reaction forces for each support
         self._reactions = {a._position: [0, 0, 0] for a in self._supports}
 
-        # substitue in value inplace of variable in functions
-        for var, ans in solution_dict.items():
-            ans = float(ans)
-            N_i_1 = N_i_1.subs(var, ans)  # complete normal force equation
-            F_i_1 = F_i_1.subs(var, ans)  # complete shear force equation
-            M_i_1 = M_i_1.subs(var, ans)  # complete moment equation
-            v_EI_1 = v_EI_1.subs(var, ans)  # complete deflection equation
-            Nv_EA = Nv_EA.subs(var, ans)  # complete axial deformation equation
-            if N_i_2:
-                N_i_2 = N_i_2.subs(var, ans)  # complete normal force equation
-            if F_i_2:
-                F_i_2 = F_i_2.subs(var, ans)  # complete shear force
-                M_i_2 = M_i_2.subs(var, ans)  # complete moment equation
-                v_EI_2 = v_EI_2.subs(var, ans)  # complete deflection equation
+        # substitue in value inplace of variable in functions. All values
+        # are substituted in a single pass over each expression. Only the
+        # first part of each equation contains the unknowns, the second
+        # part represents the contribution of DistributedLoads.
+        N_i_1 = N_i_1.xreplace(solution_dict)  # complete normal force equation
+        F_i_1 = F_i_1.xreplace(solution_dict)  # complete shear force equation
+        M_i_1 = M_i_1.xreplace(solution_dict)  # complete moment equation
+        v_EI_1 = v_EI_1.xreplace(solution_dict)  # complete deflection equation
 
+        for var, ans in solution_dict.items():
             # create self._reactions to allow for plotting of reaction
             # forces if wanted and for use with get_reaction method.
             if var not in [C1, C2]:
@@ -863,7 +853,8 @@ class Beam:
                 # as key, and using i for correct position in list.
                 # Note list for each supports reaction forces is of form
                 # [x,y,m].
-                self._reactions[position][i] = float(round(ans / converter, 10))
+                # (adding 0.0 avoids reporting a numerical -0.0)
+                self._reactions[position][i] = float(round(ans / converter, 10)) + 0.0
 
         # set calculated beam equations on beam changing all singularity
         # functions to piecewise functions (see sympy_expr_to_piecewise
@@ -884,8 +875,38 @@ class Beam:
             / (self._E * units["E"] * self._I * units["I"])
         ) / units["deflection"]
 
+        # the same equations with the singularity functions kept, these
+        # are evaluated numerically for plotting and queries.
+        self._singularity_equations = {
+            "nf": (N_i_1 + N_i_2) / units["force"],
+            "sf": (F_i_1 + F_i_2) / units["force"],
+            "bm": (M_i_1 + M_i_2) / units["moment"],
+            "d": ((v_EI_1 + v_EI_2) / (self._E * units["E"] * self._I * units["I"]))
+            / units["deflection"],
+        }
+
         self._set_plotting_vectors()
 
+    def _solve_linear_system(self, equations, unknowns):
+        """Solve a system of sympy equations that are linear in the unknowns.
+
+        Parameters
+        ----------
+        equations: list of Sympy Functions
+            Equations (each equal to 0) that are linear in the unknowns.
+        unknowns: list of Sympy Symbols
+            Unknowns to solve for.
+
+        Returns
+        -------
+        list of float
+            Solution for each of the unknowns, in the order given.
+        """
+        A, b = linear_eq_to_matrix(equations, unknowns)
+        A = np.array(A.tolist(), dtype=float)
+        b = np.array(b.tolist(), dtype=float).flatten()
+        return np.linalg.solve(A, b).tolist()
+
     def _set_plotting_vectors(self):
         """Create vectors of data points for functions to
         allow for quicker plotting and determining of results."""
@@ -905,32 +926,32 @@ class Beam:
             elif hasattr(a, "span"):
                 x_p += list(a.span)
 
-        # add incremental positions besides point to list x_i if within beam
-        x_i = []
-        for a in x_p:
-            l = a - 0.0000001
-            r = a + 0.0000001
-            if l > 0:
-                x_i.append(l)
-            if r < self._x1:
-                x_i.append(r)
+        # add incremental positions besides each point if within beam
+        x_p = np.array(x_p, dtype=float)
+        l = x_p - 0.0000001
+        r = x_p + 0.0000001
 
         # add points to x_vec, unique removes double ups and sorts
-        # need to make both numpy arrays for them to be compatible
-        x_vec = np.concatenate([x_vec, np.array(x_i)])
-        x_vec = np.unique(x_vec)
+        x_vec = np.unique(np.concatenate([x_vec, l[l > 0], r[r < self._x1]]))
 
         # lamdify functions
-        nf_func = lambdify(x, self._normal_forces, "numpy")
-        sf_func = lambdify(x, self._shear_forces, "numpy")
-        bm_func = lambdify(x, self._bending_moments, "numpy")
-        d_func = lambdify(x, self._deflection_equation, "numpy")
-
-        # create numpy arrays for functions (y vectors)
-        nf = np.array([float(nf_func(t)) for t in x_vec])
-        sf = np.array([float(sf_func(t)) for t in x_vec])
-        bm = np.array([float(bm_func(t)) for t in x_vec])
-        d = np.array([float(d_func(t)) for t in x_vec])
+        nf_func = self._lambdify(self._singularity_equations["nf"])
+        sf_func = self._lambdify(self._singularity_equations["sf"])
+        bm_func = self._lambdify(self._singularity_equations["bm"])
+        d_func = self._lambdify(self._singularity_equations["d"])
+
+        # create numpy arrays for functions (y vectors), evaluating each
+        # function over all of x_vec in one call. A constant function
+        # returns a scalar so is broadcast to the shape of x_vec.
+        nf = np.broadcast_to(nf_func(x_vec), x_vec.shape).astype(float)
+        sf = np.broadcast_to(sf_func(x_vec), x_vec.shape).astype(float)
+        bm = np.broadcast_to(bm_func(x_vec), x_vec.shape).astype(float)
+        d = np.broadcast_to(d_func(x_vec), x_vec.shape).astype(float)
+
+        # the vectors are shared by every plot and query so are made read
+        # only, plots must copy rather than modify them in place.
+        for vec in (x_vec, nf, sf, bm, d):
+            vec.setflags(write=False)
 
         # associate functions and vectors with self._plotting_vectors
         self._plotting_vectors = {
@@ -938,18 +959,26 @@ class Beam:
             "nf": {
                 "y_lam": nf_func,
                 "y_vec": nf,
+                "min": float(nf.min()),
+                "max": float(nf.max()),
             },
             "sf": {
                 "y_lam": sf_func,
                 "y_vec": sf,
+                "min": float(sf.min()),
+                "max": float(sf.max()),
             },
             "bm": {
                 "y_lam": bm_func,
                 "y_vec": bm,
+                "min": float(bm.min()),
+                "max": float(bm.max()),
             },
             "d": {
                 "y_lam": d_func,
                 "y_vec": d,
+                "min": float(d.min()),
+                "max": float(d.max()),
             },
         }
 
@@ -1044,7 +1073,6 @@ class Beam:
           specified).
         """
 
-        y_vec = self._plotting_vectors[func]["y_vec"]
         y_lam = self._plotting_vectors[func]["y_lam"]
 
         # if there are no max/min parameters set to true base
@@ -1057,22 +1085,21 @@ class Beam:
             if not isinstance(x_coord, tuple):
                 x_coord = [x_coord]
 
-            # loop through each x_coordinate in make a new list which
-            # has point infintismally at each side.
+            # evaluate the function for all x_coordinates at points
+            # infintismally at each side.
             # (The point of this is to avoid having the exact same x
             # as a singularity function value, and in the case of
             # being at a singularity value the values from each side
             # are inspected and the absmax case is returned.)
-            x_ = []
-            for p in x_coord:
-                l = p - 0.0000001
-                r = p + 0.0000001
-
-                a = round(float(y_lam(l)), 10)
-                b = round(float(y_lam(r)), 10)
+            # A constant function returns a scalar so is broadcast.
+            x_coord = np.array(x_coord, dtype=float)
+            a = np.broadcast_to(y_lam(x_coord - 0.0000001), x_coord.shape)
+            b = np.broadcast_to(y_lam(x_coord + 0.0000001), x_coord.shape)
+            a = np.round(a.astype(float), 10)
+            b = np.round(b.astype(float), 10)
 
-                c = max([a, b], key=abs)
-                x_.append(c)
+            # take the value from the left unless the right is larger
+            x_ = np.where(np.abs(b) > np.abs(a), b, a).tolist()
 
             # make a list of one only return one value to match
             # data type return from previous versions.
@@ -1080,8 +1107,9 @@ class Beam:
                 return x_[0]
             return x_
 
-        min_ = float(y_vec.min())
-        max_ = float(y_vec.max())
+        # extremes are found once when the plotting vectors are set
+        min_ = self._plotting_vectors[func]["min"]
+        max_ = self._plotting_vectors[func]["max"]
 
         if return_max:
             return round(max_, 10)
@@ -1472,48 +1500,34 @@ class Beam:
             fig.update_yaxes(visible=False, range=[-3, 3], fixedrange=True)
 
         # for each support append to figure to have the shapes/traces
-        # needed for the drawing
-        if row and col:
-            for support in self._supports:
-                fig = draw_support(
-                    fig,
-                    support,
-                    row=row,
-                    col=col,
-                    units=self._units,
-                    precision=self.decimal_precision,
-                )
-
-            for load in self._loads:
-                fig = draw_force(
-                    fig,
-                    load,
-                    row=row,
-                    col=col,
-                    units=self._units,
-                    precision=self.decimal_precision,
-                )
-                fig = draw_load_hoverlabel(
-                    fig,
-                    load,
-                    row=row,
-                    col=col,
-                    units=self._units,
-                    precision=self.decimal_precision,
-                )
-        else:
-            for support in self._supports:
-                fig = draw_support(
-                    fig, support, units=self._units, precision=self.decimal_precision
-                )
+        # needed for the drawing (row and col are None if not a subplot)
+        for support in self._supports:
+            fig = draw_support(
+                fig,
+                support,
+                row=row,
+                col=col,
+                units=self._units,
+                precision=self.decimal_precision,
+            )
 
-            for load in self._loads:
-                fig = draw_force(
-                    fig, load, units=self._units, precision=self.decimal_precision
-                )
-                fig = draw_load_hoverlabel(
-                    fig, load, units=self._units, precision=self.decimal_precision
-                )
+        for load in self._loads:
+            fig = draw_force(
+                fig,
+                load,
+                row=row,
+                col=col,
+                units=self._units,
+                precision=self.decimal_precision,
+            )
+            fig = draw_load_hoverlabel(
+                fig,
+                load,
+                row=row,
+                col=col,
+                units=self._units,
+                precision=self.decimal_precision,
+            )
 
         return fig
 
@@ -1575,83 +1589,40 @@ class Beam:
             # wont zoom in y direction
             fig.update_yaxes(visible=False, range=[-3, 3], fixedrange=True)
 
-        for position, values in self._reactions.items():
-            x_ = round(values[0], 10)
-            y_ = round(values[1], 10)
-            m_ = round(values[2], 10)
-
+        # reactions are already rounded when set by analyse, row and col
+        # are None if not a subplot.
+        for position, (x_, y_, m_) in self._reactions.items():
             # if there are reaction forces
-            if abs(x_) > 0 or abs(y_) > 0 or abs(m_) > 0:
-                # subplot case
-                if row and col:
-                    fig = draw_reaction_hoverlabel(
+            if x_ or y_ or m_:
+                fig = draw_reaction_hoverlabel(
+                    fig,
+                    reactions=[x_, y_, m_],
+                    x_sup=position,
+                    row=row,
+                    col=col,
+                    units=self._units,
+                    precision=self.decimal_precision,
+                )
+
+                # only create loads for the non zero reaction forces
+                loads = []
+                if x_:
+                    loads.append(PointLoad(x_, position, 0))
+                if y_:
+                    loads.append(PointLoad(y_, position, 90))
+                if m_:
+                    loads.append(PointTorque(m_, position))
+
+                for load in loads:
+                    fig = draw_force(
                         fig,
-                        reactions=[x_, y_, m_],
-                        x_sup=position,
+                        load,
                         row=row,
                         col=col,
                         units=self._units,
                         precision=self.decimal_precision,
                     )
 
-                    if abs(x_) > 0:
-                        fig = draw_force(
-                            fig,
-                            PointLoad(x_, position, 0),
-                            row=row,
-                            col=col,
-                            units=self._units,
-                            precision=self.decimal_precision,
-                        )
-                    if abs(y_) > 0:
-                        fig = draw_force(
-                            fig,
-                            PointLoad(y_, position, 90),
-                            row=row,
-                            col=col,
-                            units=self._units,
-                            precision=self.decimal_precision,
-                        )
-                    if abs(m_) > 0:
-                        fig = draw_force(
-                            fig,
-                            PointTorque(m_, position),
-                            row=row,
-                            col=col,
-                            units=self._units,
-                            precision=self.decimal_precision,
-                        )
-                else:
-                    fig = draw_reaction_hoverlabel(
-                        fig,
-                        reactions=[x_, y_, m_],
-                        x_sup=position,
-                        units=self._units,
-                        precision=self.decimal_precision,
-                    )
-
-                    if abs(x_) > 0:
-                        fig = draw_force(
-                            fig,
-                            PointLoad(x_, position, 0),
-                            units=self._units,
-                            precision=self.decimal_precision,
-                        )
-                    if abs(y_) > 0:
-                        fig = draw_force(
-                            fig,
-                            PointLoad(y_, position, 90),
-                            units=self._units,
-                            precision=self.decimal_precision,
-                        )
-                    if abs(m_) > 0:
-                        fig = draw_force(
-                            fig,
-                            PointTorque(m_, position),
-                            units=self._units,
-                            precision=self.decimal_precision,
-                        )
-
         return fig
 
     def plot_normal_force(
@@ -2003,42 +1974,45 @@ class Beam:
             fig.update_yaxes(autorange="reversed") if reverse_y else None
             fig.update_xaxes(autorange="reversed") if reverse_x else None
 
-        for q_val in self._query:
-            q_res = self._get_query_value(q_val, func)
-            if q_res < 0:
-                ay = 40
-            else:
-                ay = -40
+        # evaluate the function at all of the query points in one call
+        q_results = np.atleast_1d(
+            self._get_query_value(tuple(self._query), func)
+        ).tolist()
+
+        # axis references of the plot or subplot to annotate
+        if row and col:
+            subplot = fig.get_subplot(row, col)
+            xref = subplot.xaxis.plotly_name.replace("axis", "")
+            yref = subplot.yaxis.plotly_name.replace("axis", "")
+        else:
+            xref, yref = "x", "y"
+
+        annotations = []
+        for q_val, q_res in zip(self._query, q_results):
+            # annotation arrow offset points away from the function value
+            offset = 40 if q_res < 0 else -40
+
+            annotation = dict(
+                x=q_val,
+                y=q_res,
+                text=f"{q_val:.{p}f} {xunits}<br>{q_res:.{p}f} {yunits}",
+                showarrow=True,
+                arrowhead=1,
+                xref=xref,
+                yref=yref,
+                ax=0,
+                ay=offset,
+            )
 
             if switch_axes:
+                annotation.update(x=q_res, y=q_val, ax=offset, ay=0)
 
-                annotation = dict(
-                    x=q_res,
-                    y=q_val,
-                    text=f"{q_val:.{p}f} {xunits}<br>{q_res:.{p}f} {yunits}",
-                    showarrow=True,
-                    arrowhead=1,
-                    xref="x",
-                    yref="y",
-                    ax=ay,
-                    ay=0,
-                )
-            else:
-                annotation = dict(
-                    x=q_val,
-                    y=q_res,
-                    text=f"{q_val:.{p}f} {xunits}<br>{q_res:.{p}f} {yunits}",
-                    showarrow=True,
-                    arrowhead=1,
-                    xref="x",
-                    yref="y",
-                    ax=0,
-                    ay=ay,
-                )
-            if row and col:
-                fig.add_annotation(annotation, row=row, col=col)
-            else:
-                fig.add_annotation(annotation)
+            annotations.append(annotation)
+
+        # add all annotations in one layout update, adding them one at a
+        # time revalidates all existing annotations for every query.
+        if annotations:
+            fig.layout.annotations += tuple(annotations)
 
         return fig
 
@@ -2055,6 +2029,26 @@ class Beam:
         assert type(n) is int
         self.decimal_precision = n
 
+    def update_data_points(self, n):
+        """Updates the number of data points used to plot the beam
+        functions (default 200).
+
+        Parameters
+        ----------
+        n : int
+            Number of evenly spaced data points along the beam. Points
+            either side of each support and load are always added.
+        """
+
+        # make sure input is integer
+        assert type(n) is int
+        self._DATA_POINTS = n
+
+        # if the beam has already been analysed only the plotting
+        # vectors need to be recalculated, not the analysis.
+        if self._plotting_vectors:
+            self._set_plotting_vectors()
+
     def __str__(self):
         return f"""--------------------------------
         <Beam>
@@ -2095,7 +2089,7 @@ class Beam:
 
         # case 1
         if isinstance(func, SingularityFunction):
-            return func._eval_rewrite_as_Piecewise()
+            return _singularity_to_piecewise(func)
         # case 2 and 3
         elif func.is_Mul or func.is_Add:
             # nesting cases now, could use recursion to cover all possible
@@ -2105,7 +2099,7 @@ class Beam:
                 temp = 1
                 for m in func.args:
                     if isinstance(m, SingularityFunction):
-                        temp *= m._eval_rewrite_as_Piecewise()
+                        temp *= _singularity_to_piecewise(m)
                     else:
                         temp *= m
                 return temp
@@ -2116,13 +2110,13 @@ class Beam:
                 for a in func.args:
                     # case 2 b
                     if isinstance(a, SingularityFunction):
-                        temp += a._eval_rewrite_as_Piecewise()
+                        temp += _singularity_to_piecewise(a)
                     # case 2 a
                     elif a.is_Mul:
                         temp_mul = 1
                         for m in a.args:
                             if isinstance(m, SingularityFunction):
-                                temp_mul *= m._eval_rewrite_as_Piecewise()
+                                temp_mul *= _singularity_to_piecewise(m)
                             else:
                                 temp_mul *= m
                         temp += temp_mul
@@ -2135,6 +2129,102 @@ class Beam:
         else:
             return func
 
+    def _integrate(self, func):
+        """Integrates a sympy function with respect to x.
+
+        Terms consisting of a coefficient multiplied by a single
+        SingularityFunction (or terms independent of x) are integrated
+        directly using the singularity function power rule, skipping
+        sympy's general integration routine. Any remaining terms (such as
+        the Piecewise functions of a DistributedLoad) are integrated with
+        sympy.
+
+        Parameters
+        ----------
+        func: Sympy Function
+            Sympy Function containing some SingularityFunction expressions.
+
+        Returns
+        -------
+        func: Sympy Function
+            Indefinite integral of the Sympy Function with respect to x.
+        """
+        result = 0
+        remainder = 0
+        for term in Add.make_args(sympify(func)):
+            coeff, f = term.as_independent(x, as_Add=False)
+            if f == 1:
+                result += coeff * x
+            elif isinstance(f, SingularityFunction) and f.args[0] == x:
+                a, n = f.args[1], f.args[2]
+                # <x-a>^n integrates to <x-a>^(n+1) for the singular
+                # (negative) powers and to <x-a>^(n+1) / (n+1) otherwise.
+                if n < 0:
+                    result += coeff * SingularityFunction(x, a, n + 1)
+                else:
+                    result += coeff * SingularityFunction(x, a, n + 1) / (n + 1)
+            else:
+                remainder += term
+
+        if remainder != 0:
+            result += integrate(remainder, x)
+
+        return result
+
+    def _lambdify(self, func):
+        """Create a numpy function of x from a sympy function.
+
+        Terms consisting of a coefficient multiplied by a single
+        SingularityFunction (i.e. all terms due to point loads, UDLs,
+        trapezoidal loads and reactions) are stored as arrays of
+        coefficients, positions and powers and evaluated directly with
+        numpy. Only the remaining terms (such as the Piecewise functions of
+        a DistributedLoad) are lambdified, as generating code for every
+        singularity term is far slower than evaluating it.
+
+        Parameters
+        ----------
+        func: Sympy Function
+            Sympy Function containing some SingularityFunction expressions.
+
+        Returns
+        -------
+        function
+            Function taking a float or numpy array of x coordinates and
+            returning the value of the Sympy Function at each.
+        """
+        coeffs, positions, powers = [], [], []
+        remainder = 0
+        for term in Add.make_args(sympify(func)):
+            coeff, f = term.as_independent(x, as_Add=False)
+            if isinstance(f, SingularityFunction) and f.args[0] == x:
+                coeffs.append(float(coeff))
+                positions.append(float(f.args[1]))
+                powers.append(int(f.args[2]))
+            else:
+                remainder += term
+
+        coeffs = np.array(coeffs)
+        positions = np.array(positions)
+        powers = np.array(powers, dtype=int)
+        singular = powers < 0
+        powers = np.where(singular, 0, powers)
+        remainder_func = _lambdify_equation(remainder)
+
+        def func_(x_vec):
+            # distance of each x coordinate from each singularity, the
+            # singularity terms are the last axis.
+            x_a = np.subtract.outer(x_vec, positions)
+
+            # <x-a>^n is (x-a)^n from a onwards (n >= 0), the singular
+            # powers (n < 0) are infinite at a and otherwise 0.
+            values = np.where(x_a >= 0, x_a**powers, 0.0)
+            values = np.where(singular, np.where(x_a == 0, np.inf, 0.0), values)
+
+            return (coeffs * values).sum(axis=-1) + remainder_func(x_vec)
+
+        return func_
+
 
 if __name__ == "__main__":
     beam = Beam(5)
@@ -1,11 +1,14 @@
 """Module containing load classes."""
 
 # Standard Libary Imports
-from math import radians
+from functools import lru_cache
+from math import radians, sin, cos
 
 # Third Party Imports
+import numpy as np
+from numpy.polynomial.polynomial import polyint, polyval
 from sympy.abc import x
-from sympy import oo, integrate, SingularityFunction, sympify, cos, sin, Piecewise
+from sympy import oo, integrate, SingularityFunction, sympify, Piecewise, Poly
 
 # Local application imports
 from indeterminatebeam.data_validation import (
@@ -16,6 +19,14 @@ from indeterminatebeam.data_validation import (
 )
 
 
+@lru_cache(maxsize=128)
+def _integrate_load(expr, limits=x):
+    """Return the integral of a load function (with respect to x unless
+    other limits are given), cached so that recreating the same load only
+    integrates once."""
+    return integrate(expr, limits)
+
+
 class Load:
     """Load class from which all other types of loads inherit."""
 
@@ -50,10 +61,10 @@ class Load:
             self._y0 = 0
 
         # self._x1 represents NF(x), normal force as function of x.
-        self._x1 = integrate(self._x0, x)  # NF
+        self._x1 = _integrate_load(self._x0)  # NF
 
         # self._y1 represents SF(x), shear force as function of x.
-        self._y1 = integrate(self._y0, x)  # SF
+        self._y1 = _integrate_load(self._y0)  # SF
 
 
 class PointTorque(Load):
@@ -327,8 +338,8 @@ class DistributedLoad(Load):
     def __init__(self, expr, span=(0, 0), angle=0):
         # Validate expr.
         try:
-            expr = sympify(expr)
-            expr = Piecewise((0, x < span[0]), (0, x > span[1]), (expr, True))
+            load = sympify(expr)
+            expr = Piecewise((0, x < span[0]), (0, x > span[1]), (load, True))
             
         except BaseException:
             print("Can not convert expression to sympy function. "+
@@ -351,13 +362,25 @@ class DistributedLoad(Load):
         self._add_load_functions(angle, expr)
 
         # self._m0 is moment induced by load about coord 0.
-        self._m0 = integrate(self._y0 * x, (x, 0, span[1]))
+        # For a polynomial load (the typical case) integrate the
+        # coefficients with numpy, otherwise integrate symbolically.
+        if load.is_polynomial(x) and load.free_symbols <= {x}:
+            force_y = sin(radians(angle))
+            c = np.array(Poly(load * x, x).all_coeffs()[::-1], dtype=float)
+            c = polyint(c)
+            self._m0 = force_y * float(polyval(span[1], c) - polyval(span[0], c))
+        else:
+            self._m0 = _integrate_load(self._y0 * x, (x, 0, span[1]))
 
         # Assign other inputs to load object
         self.span = span
         self.expr = expr
         self.angle = angle
 
+        # load function within the span (without the Piecewise conditions),
+        # cheaper to lambdify and evaluate when only plotting the span.
+        self._span_expr = load
+
 # simplified load types- vertical and horizontal direction classes
 
 class PointLoadV(PointLoad):
@@ -1,11 +1,12 @@
 """Module to help draw plotly shapes, drawing and annotations"""
 
 # Standard Library Imports
-from math import radians
+from functools import lru_cache
+from math import radians, sin, cos
 
 # Third Party Imports
 import numpy as np
-from sympy import lambdify, sympify, sin, cos, oo
+from sympy import lambdify, oo
 from sympy.abc import x
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
@@ -22,6 +23,13 @@ from indeterminatebeam.loading import(
 )
 
 
+@lru_cache(maxsize=128)
+def _lambdify_load(expr):
+    """Return a numpy function for a distributed load expression, cached
+    so that repeated plotting of the same load only lambdifies once."""
+    return lambdify(x, expr, 'numpy')
+
+
 def draw_line(fig, angle, x_sup, length=-20, xoffset=0, yoffset=0,
               color='red', line_width=2, row=None, col=None):
     """Draw an anchored line on a plotly figure.
@@ -61,8 +69,8 @@ def draw_line(fig, angle, x_sup, length=-20, xoffset=0, yoffset=0,
     # Establish line start and end coordinates.
     x0 = xoffset
     y0 = yoffset
-    x1 = x0 + int(sympify(length * cos(radians(angle))).evalf(2))
-    y1 = y0 + int(sympify(length * sin(radians(angle))).evalf(2))
+    x1 = x0 + round(length * cos(radians(angle)))
+    y1 = y0 + round(length * sin(radians(angle)))
 
     # Create dictionary for shape object representing line.
     shape = dict(
@@ -216,41 +224,41 @@ def draw_arrow(fig, angle, force, x_sup, xoffset=0, yoffset=0, color='red',
     else:
         return fig
 
-    # Draw arrowhead for force
-    fig = draw_arrowhead(
-        fig,
-        angle,
-        x_sup,
-        length=arrowhead * d,
-        xoffset=xoffset,
-        yoffset=yoffset,
-        color=color,
-        line_width=line_width,
-        row=row,
-        col=col)
+    # Build the arrowhead and arrowline as a single path shape rather than
+    # three separate line shapes (as draw_arrowhead and draw_line would),
+    # every shape added to a figure revalidates all of the existing shapes.
+    x0 = xoffset
+    y0 = yoffset
+    points = []
+    for a, length in [
+            (225 + angle, arrowhead * d),
+            (135 + angle, arrowhead * d),
+            (angle, -1 * arrowlength * d)]:
+        points.append((
+            x0 + round(length * cos(radians(a))),
+            y0 + round(length * sin(radians(a)))))
+
+    (xa, ya), (xb, yb), (xl, yl) = points
+    shape = dict(
+        type="path",
+        xref="x", yref="y",
+        path=f"M {xa},{ya} L {x0},{y0} L {xb},{yb} M {x0},{y0} L {xl},{yl}",
+        line_color=color, line_width=line_width,
+        xsizemode='pixel', ysizemode='pixel',
+        xanchor=x_sup, yanchor=0)
+
+    # Append shape to plot or subplot
+    if row and col:
+        fig.add_shape(shape, row=row, col=col)
+    else:
+        fig.add_shape(shape)
 
-    # Draw arrowline for force
-    fig = draw_line(
-        fig,
-        angle,
-        x_sup,
-        length=-1 * arrowlength * d,
-        xoffset=xoffset,
-        yoffset=yoffset,
-        color=color,
-        line_width=line_width,
-        row=row,
-        col=col)
     if show_values:
         # determine start and end of arrow
         x0 = xoffset + x_sup
         y0 = yoffset
-        x1 = (
-            int(sympify(-arrowlength * d * cos(radians(angle))).evalf(2))
-            ) * 1.1
-        y1 = (
-            int(sympify(-arrowlength * d * sin(radians(angle))).evalf(2))
-            ) * 1.3
+        x1 = round(-arrowlength * d * cos(radians(angle))) * 1.1
+        y1 = round(-arrowlength * d * sin(radians(angle))) * 1.3
 
         # make so text doesnt intersect x axis
         if abs(y1) < 5:
@@ -556,11 +564,15 @@ def draw_force(
         if isinstance(load, DistributedLoad):
             name = 'Distributed<br>Load'
             x0, x1 = load.span
-            expr = load.expr
             # numpy array for x positions closely spaced (allow for graphing)
             x_vec = np.linspace(x0, x1, int(min((x1 - x0) * 100 + 1, 1e3)))
-            y_lam = lambdify(x, expr, 'numpy')
-            y_vec = np.array([round(float(y_lam(t)), 10) for t in x_vec])
+            # only the span is plotted so the Piecewise conditions of the
+            # load are not needed.
+            y_lam = _lambdify_load(load._span_expr)
+            # evaluate over all of x_vec at once, broadcasting in case
+            # the function returns a scalar
+            y_vec = np.broadcast_to(y_lam(x_vec), x_vec.shape).astype(float)
+            y_vec = np.round(y_vec, 10)
 
         elif isinstance(load, UDL):
             name = 'UDL'
@@ -571,7 +583,7 @@ def draw_force(
             x_vec = np.array(load.span)
             y_vec = np.array(load.force)
 
-        largest = abs(max(y_vec, key=abs))
+        largest = np.abs(y_vec).max()
 
         # draw each function normalised to 1. ie the max is always 1.
         # largest accounts for magnitude, angle factor rectifies polarity.
@@ -703,10 +715,16 @@ def draw_load_hoverlabel(
         name = 'Distributed<br>Load'
 
         if isinstance(load, DistributedLoad):
-            expr = load.expr
+            # evaluate the load at both ends of the span in one call, using
+            # the same lambdified function used to draw the load.
+            y_lam = _lambdify_load(load._span_expr)
+            x_vec = np.array([x0, x1], dtype=float)
+            y0, y1 = np.round(
+                np.broadcast_to(y_lam(x_vec), x_vec.shape).astype(float), 10
+            ).tolist()
             meta = [
-                (x0, round(float(expr.subs(x, x0)), 10), angle),
-                (x1, round(float(expr.subs(x, x1)), 10), angle)
+                (x0, y0, angle),
+                (x1, y1, angle)
             ]
 
         elif isinstance(load, UDL):
@@ -262,7 +262,14 @@ class BeamTestCase(unittest.TestCase):
         self.assertEqual(round(beam.get_deflection(3000),1), 3.6)
         self.assertEqual(round(beam.get_deflection(return_max=True),1), 4.1)
         self.assertEqual(round(beam.get_deflection(return_min=True),1), -0.3)
-    
+
+        # changing the data points after analysis recalculates the
+        # plotting vectors without changing the results
+        beam.update_data_points(500)
+        self.assertTrue(len(beam._plotting_vectors['x']) >= 500)
+        self.assertEqual(round(beam.get_shear_force(1000),3), -2.382)
+        self.assertEqual(round(beam.get_deflection(return_max=True),1), 4.1)
+
     def test_sympy(self):
         # A solving error was observed for sympy version 1.8
         # test that this error does not occur for the installed version of sympy